@@ -21,12 +21,15 @@ def generate_fixture(args):
     # Add the pyramid
     box = generate_box_body(0.5, 0.5, [0, 0], 0, 10)
     nrows = 5
-    for i in range(nrows):
-        y = (1 + 1e-1) * i + 0.6
-        for j in range(nrows - i):
-            x = (1 + 1e-1) * j - (1 + 1e-1) * (nrows - i) / 2
-            box["position"] = [x, y]
-            rigid_bodies.append(box.copy())
+    spacing = 1 + 1e-1
+
+    def place_box(i, j):
+        x = spacing * j - spacing * (nrows - i) / 2
+        y = spacing * i + 0.6
+        return {**box, "position": [x, y]}
+
+    rigid_bodies.extend(
+        place_box(i, j) for i in range(nrows) for j in range(nrows - i))
 
     return fixture
 
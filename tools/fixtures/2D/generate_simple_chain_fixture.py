@@ -38,12 +38,17 @@ def generate_fixture(n_links: int) -> dict:
     """Generate a fixture of a chain with N simple links."""
     fixture = generate_default_fixture()
     rigid_bodies = fixture["rigid_body_problem"]["rigid_bodies"]
+    # Convert the link geometry once and offset it in Python per link
+    vertices_list = vertices.tolist()
+    edges_list = edges.tolist()
+    falling_velocity = [0.0, -1.0, 0.0]
+    free_dof = [False, False, False]
     for i in range(n_links):
         rigid_bodies.append({
-            "vertices": (vertices + [0, -4.5 * i]).tolist(),
-            "edges": edges.tolist(),
-            "velocity": [0.0, -1.0 if i else 0.0, 0.0],
-            "is_dof_fixed": [i == 0, i == 0, i == 0],
+            "vertices": [[x, y - 4.5 * i] for x, y in vertices_list],
+            "edges": edges_list,
+            "velocity": falling_velocity if i else [0.0, 0.0, 0.0],
+            "is_dof_fixed": free_dof if i else [True, True, True],
         })
     return fixture
 
@@ -1,7 +1,6 @@
 import sys
 import json
 import pathlib
-import copy
 import math
 import itertools
 
@@ -53,29 +52,44 @@ row_gap = link_height / 2.5
 col_gap = link_height / 10
 
 # Generate the chain net
-for i in range(net_rows):
-    for j in range(net_cols):
-        if (i == 0 and j == 0 or
-                i == 0 and j == net_cols - 1 or
-                i == net_rows - 1 and j == 0 or
-                i == net_rows - 1 and j == net_cols - 1):
-            continue
-        bodies.append(copy.deepcopy(link))
-        bodies[-1]["rotation"] = [90, 90, 0]
-        bodies[-1]["position"] = [
-            j * (link_height + col_gap), 0, i * (link_width + row_gap)]
-        if i == 0 or i == net_rows - 1 or j == 0 or j == net_cols - 1:
-            bodies[-1]["is_dof_fixed"] = True
-        if i != 0 and i != net_rows - 1 and j < net_cols - 1:
-            bodies.append(copy.deepcopy(link))
-            bodies[-1]["rotation"] = [0, 0, 90]
-            bodies[-1]["position"] = [
-                (j + 0.5) * (link_height + col_gap), 0, i * (link_width + row_gap)]
-        if j != 0 and j != net_rows - 1 and i < net_rows - 1:
-            bodies.append(copy.deepcopy(link))
-            bodies[-1]["rotation"] = [90, 0, 90]
-            bodies[-1]["position"] = [
-                j * (link_height + col_gap), 0, (i + 0.5) * (link_width + row_gap)]
+J, I = numpy.meshgrid(numpy.arange(net_cols), numpy.arange(net_rows))
+is_edge_row = (I == 0) | (I == net_rows - 1)
+is_edge_col = (J == 0) | (J == net_cols - 1)
+corner_mask = is_edge_row & is_edge_col
+x_spacing = link_height + col_gap
+z_spacing = link_width + row_gap
+# Bodies are ordered cell by cell (row-major) and, within a cell, by link
+# family; the order fixes the body/vertex indices used by the simulator.
+cell_index = I * net_cols + J
+links = []
+
+
+def add_links(family, mask, xs, zs, rotation, is_dof_fixed=None):
+    if is_dof_fixed is None:
+        is_dof_fixed = numpy.full(mask.shape, link["is_dof_fixed"])
+    links.extend((key, {
+        **link,
+        "rotation": rotation,
+        "position": [x, 0, z],
+        "is_dof_fixed": fixed
+    }) for key, x, z, fixed in zip((3 * cell_index + family)[mask].tolist(),
+                                   xs[mask].tolist(), zs[mask].tolist(),
+                                   is_dof_fixed[mask].tolist()))
+
+
+# Links along the grid points (the boundary is fixed)
+add_links(0, ~corner_mask, J * x_spacing, I * z_spacing, [90, 90, 0],
+          is_edge_row | is_edge_col)
+# Links between grid points along the x-axis
+add_links(1, ~is_edge_row & (J < net_cols - 1), (J + 0.5) * x_spacing,
+          I * z_spacing, [0, 0, 90])
+# Links between grid points along the z-axis
+add_links(2, ~corner_mask & (J != 0) & (J != net_rows - 1) &
+          (I < net_rows - 1), J * x_spacing, (I + 0.5) * z_spacing,
+          [90, 0, 90])
+
+links.sort(key=lambda key_body: key_body[0])
+bodies.extend(body for _, body in links)
 
 # Add block of cubes
 
@@ -1,12 +1,18 @@
 """Function to get the default dictionary for fixtures."""
 
 import argparse
+import math
 import pathlib
 
 import numpy
 import shapely.geometry
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DEFAULT_TIMESTEP = 1e-2
 DEFAULT_INITIAL_EPSILON = 1e-1
 DEFAULT_RESTITUTION_COEFFICIENT = -1
@@ -189,9 +195,43 @@ def print_args(args: argparse.Namespace) -> None:
         print(f"{k}: {v}")
 
 
+def _json_default(obj):
+    """Convert numpy scalars (e.g., a density computed with numpy)."""
+    if isinstance(obj, numpy.generic):
+        return obj.item()
+    raise TypeError(
+        f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _check_finite(obj) -> None:
+    """Raise a ValueError if the fixture contains an infinite or NaN value."""
+    if isinstance(obj, (float, numpy.floating)):
+        if not math.isfinite(obj):
+            raise ValueError(f"fixture contains a non-finite value: {obj}")
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            _check_finite(value)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            _check_finite(value)
+
+
 def save_fixture(fixture, fname):
+    """
+    Save a fixture as compact JSON.
+
+    Uses orjson if it is installed and the stdlib json module otherwise. Both
+    accept the same inputs (including numpy scalars) and reject infinite/NaN
+    values, which orjson would silently write as null.
+    """
+    _check_finite(fixture)
+    if orjson is not None:
+        with open(fname, "wb") as outfile:
+            outfile.write(orjson.dumps(fixture, default=_json_default))
+        return
     with open(fname, "w") as outfile:
-        json.dump(fixture, outfile, indent=None, separators=(',', ':'))
+        outfile.write(json.dumps(fixture, indent=None, separators=(',', ':'),
+                                 default=_json_default))
 
 
 def get_fixture_dir_path() -> pathlib.Path: